@@ -6,9 +6,17 @@ from amaranth.utils import bits_for
 from amaranth_soc import wishbone
 from amaranth_soc.memory import MemoryMap
 
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=None)
+def _load_verilog(name):
+    # The pre-converted sources are large and immutable, so read each one at most once
+    # regardless of how many cores or debug modules are elaborated.
+    return (Path(__file__).parent / "verilog" / name).read_text()
+
+
 class _OBISignature(wiring.Signature):
     def __init__(self):
         super().__init__({
@@ -226,9 +234,8 @@ class CV32E40P(wiring.Component):
         connect(m, dbus_adapt.wb, flipped(self.dbus))
 
         if platform is not None:
-            path = Path(__file__).parent / "verilog/cv32e40p_conv_sv2v.v"
-            with open(path, 'r') as f:
-                platform.add_file(path.name, f)
+            name = "cv32e40p_conv_sv2v.v"
+            platform.add_file(name, _load_verilog(name))
         return m
 
 class OBIDebugModule(wiring.Component):
@@ -322,8 +329,7 @@ class OBIDebugModule(wiring.Component):
         connect(m, tgt_adapt.wb, flipped(self.target))
 
         if platform is not None:
-            path = Path(__file__).parent / "verilog/dm_wrap_conv_sv2v.v"
-            with open(path, 'r') as f:
-                platform.add_file(path.name, f)
+            name = "dm_wrap_conv_sv2v.v"
+            platform.add_file(name, _load_verilog(name))
 
         return m
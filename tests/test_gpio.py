@@ -66,8 +66,6 @@ class PeripheralTestCase(unittest.TestCase):
         Smoke test GPIO. We assume that amaranth-soc GPIO tests are fully testing functionality.
         """
 
-        warnings.simplefilter(action="ignore", category=UnusedElaboratable)
-
         dut = GPIOPeripheral(pin_count=4, addr_width=2, data_width=8)
 
         mode_addr   = 0x0